@@ -24,13 +24,15 @@ else
 fi
 
 echo -n "Downloading datasets from \"$FIGSHARE_BASE_URL\"... "
+# Both splits are fetched concurrently; `wait` blocks until both are in.
 wget --no-check-certificate \
      --quiet \
      "$FIGSHARE_BASE_URL/$TRAIN_FILE_ID" \
-     -O "$DATASET_DIRECTORY/$TRAIN_FILE_NAME"
+     -O "$DATASET_DIRECTORY/$TRAIN_FILE_NAME" &
 wget --no-check-certificate \
      --quiet \
      "$FIGSHARE_BASE_URL/$TEST_FILE_ID" \
-     -O "$DATASET_DIRECTORY/$TEST_FILE_NAME"
+     -O "$DATASET_DIRECTORY/$TEST_FILE_NAME" &
+wait
 echo "Done."
 
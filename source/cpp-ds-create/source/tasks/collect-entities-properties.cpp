@@ -7,7 +7,7 @@
 
 using namespace DutchKBQADSCreate;
 
-const char *wikidata_ent_prp_regex = "[QP][0-9]+";
+const std::regex wikidata_ent_prp_query("[QP][0-9]+");
 
 /**
  * @brief Returns the entities and properties discoverable in `question`.
@@ -19,10 +19,9 @@ const char *wikidata_ent_prp_regex = "[QP][0-9]+";
 std::set<std::string> entities_and_properties_of_question(const Json::Value &question) {
     const std::string sparql = question["sparql_wikidata"].asString();
     std::set<std::string> s;
-    const std::regex ent_prp_query(wikidata_ent_prp_regex);
     for (std::sregex_iterator it(sparql.begin(),
                               sparql.end(),
-                              ent_prp_query);
+                              wikidata_ent_prp_query);
          it != std::sregex_iterator();
          ++it) {
         s.insert(it->str());
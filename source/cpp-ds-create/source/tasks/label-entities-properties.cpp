@@ -292,28 +292,6 @@ std::string url_encoded_string(const std::string &str) {
 
 const std::string wikidata_query_service_url = "https://query.wikidata.org/";
 
-/**
- * @brief Writes binary data items from a source location, `ptr`, to a stream
- *   handled by a caller, doing this without printing anything to standard
- *   output.
- *
- * Normally, this `fwrite`-like function has a fourth parameter: `FILE *stream`,
- * pointing to a stream to which the data items should be written. This method,
- * being a callback for `curlpp`, omits this parameter.
- *
- * @param ptr The location where data items are to be obtained from.
- * @param size The size in bytes of each single data item. For `curl` and
- *   `curlpp`, this size is always 1 (byte).
- * @param n_mem The number of data items.
- * @return The number of bytes successfully written to the target stream, which
- *   is handled by the consuming `curlpp` code. If this number of bytes does
- *   equal the total size of all data items, an error is supposed to be raised
- *   by the caller.
- */
-size_t muted_write_function([[maybe_unused]] char *ptr, size_t size, size_t n_mem_b) {
-    return size * n_mem_b;
-}
-
 /**
  * @brief Sets request headers for querying WikiData, meant for obtaining the
  *   labels of entities and properties.
@@ -332,7 +310,6 @@ void set_wikidata_request_headers(curlpp::Easy &request,
     request.setOpt(new curlpp::Options::Url(wikidata_query_service_url +
                                             "sparql?query=" +
                                             encoded));
-    request.setOpt(new curlpp::Options::WriteFunction(muted_write_function));
 }
 
 /**
@@ -369,8 +346,11 @@ const int query_interval_seconds_to_wait = 3;
  *   retrying when various types of network issues arise.
  *
  * @param request The WikiData label-extraction request to perform.
+ * @param response The stream the request writes its response body to. It is
+ *   emptied before each attempt, so that only the final body remains.
  */
-void perform_wikidata_entity_and_property_labels_request(curlpp::Easy &request) {
+void perform_wikidata_entity_and_property_labels_request(curlpp::Easy &request,
+                                                         std::stringstream &response) {
     std::optional<size_t> res_code = std::nullopt;
     do {
         if (res_code.has_value() && res_code == 429) {
@@ -380,6 +360,8 @@ void perform_wikidata_entity_and_property_labels_request(curlpp::Easy &request)
                                      std::to_string(res_code.value()) +
                                      " from WikiData. Aborting.");
         }
+        response.str("");
+        response.clear();
         request.perform();
         res_code = curlpp::Infos::ResponseCode::get(request);
     } while (res_code.has_value() && res_code.value() != 200);
@@ -390,21 +372,23 @@ void perform_wikidata_entity_and_property_labels_request(curlpp::Easy &request)
  * @brief Returns the labels in `language` for the specified set of entities
  *   and properties, `ent_prp_part`.
  *
+ * @param request The request object to query WikiData with. Reusing it across
+ *   parts lets `curl` keep its connection to WikiData alive.
  * @param ent_prp_part An entity-and-property part of a partition.
  * @param language The natural language to get the labels in.
  * @return A mapping from entities and properties to arrays of zero or more
  *   labels in the required `language`.
  */
-Json::Value entity_and_property_labels_of_part(const std::set<std::string> &ent_prp_part,
+Json::Value entity_and_property_labels_of_part(curlpp::Easy &request,
+                                               const std::set<std::string> &ent_prp_part,
                                                const NaturalLanguage &language) {
-    curlpp::Easy request;
+    std::stringstream response;
     set_wikidata_request_headers(request, ent_prp_part, language);
-    perform_wikidata_entity_and_property_labels_request(request);
+    request.setOpt(new curlpp::Options::WriteStream(&response));
+    perform_wikidata_entity_and_property_labels_request(request, response);
 
-    std::stringstream result;
-    result << request;
     Json::Value json;
-    result >> json;
+    response >> json;
 
     return restructured_wikidata_entity_and_property_labels(ent_prp_part, json["results"]["bindings"]);
 }
@@ -427,12 +411,13 @@ void label_entity_property_partitions_backend(const LCQuADSplit &split,
     std::set<std::string> require_labelling = entities_and_properties_requiring_labeling(split, language);
     ent_prp_partitioning partitioning = entity_property_partitioning(require_labelling, part_size);
     int count = 0;
+    curlpp::Easy request;  /* shared across parts, such that the connection is reused */
     if (!quiet) {
         std::cout << "\rStarting with labelling entities and properties...";
         std::cout << std::flush;
     }
     for (const auto &part : partitioning) {
-        Json::Value labels = entity_and_property_labels_of_part(part, language);
+        Json::Value labels = entity_and_property_labels_of_part(request, part, language);
         save_entity_and_property_labels(labels, split, language);
         if (!quiet) {
             printf("\rRetrieved labels for part %5d/%5d (%6.2lf%%)",
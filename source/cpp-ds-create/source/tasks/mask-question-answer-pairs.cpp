@@ -4,6 +4,7 @@
 #include <utility>
 #include <cassert>
 #include <regex>
+#include <unordered_map>
 #include "tasks/mask-question-answer-pairs.hpp"
 #include "tasks/collect-entities-properties.hpp"
 #include "tasks/label-entities-properties.hpp"
@@ -43,12 +44,40 @@ DutchKBQADSCreate::LabelMatch::LabelMatch(const std::string &label,
 }
 
 
+/* Used to escape square brackets in labels before they are used as RegExes. */
+const std::regex square_bracket_query("([\\[\\]])");
+
+/**
+ * @brief The maximum number of label RegExes to keep around at once. When
+ *   exceeded, the cache is emptied and built up anew.
+ */
+const std::size_t max_cached_label_queries = 16384;
+
+/**
+ * @brief Returns the RegEx with which to search for `label` in sentences.
+ *
+ * The same labels are searched for in many questions, and constructing a
+ * `std::regex` is expensive. Hence, RegExes are cached per label.
+ *
+ * @param label The label to get the RegEx of.
+ * @return The RegEx.
+ */
+const std::regex &label_query(const std::string &label) {
+    static std::unordered_map<std::string, std::regex> cached_queries;
+    auto cached = cached_queries.find(label);
+    if (cached == cached_queries.end()) {
+        if (cached_queries.size() >= max_cached_label_queries) {
+            cached_queries.clear();
+        }
+        const std::string inner_re = std::regex_replace(label, square_bracket_query, "\\$1");
+        cached = cached_queries.emplace(label, std::regex("(" + inner_re + ")")).first;
+    }
+    return cached->second;
+}
+
 std::optional<index_range> DutchKBQADSCreate::LabelMatch::match_label_in_sentence(const std::string &label,
                                                                                   const std::string &sentence) {
-    std::string inner_re = label;
-    inner_re = std::regex_replace(inner_re, std::regex("(\\[)"), "\\[");
-    inner_re = std::regex_replace(inner_re, std::regex("(\\])"), "\\]");
-    std::regex re("(" + inner_re + ")");
+    const std::regex &re = label_query(label);
     std::smatch label_re_match;
     if (std::regex_search(sentence, label_re_match, re)) {
         int start_idx = static_cast<int>(label_re_match.position(0));
@@ -314,6 +343,32 @@ void DutchKBQADSCreate::mask_single_entity_or_property_in_question(std::string &
     q = std::regex_replace(q, std::regex("(" + match.label + ")"), replacement);
 }
 
+/**
+ * @brief Returns `str`, but with all non-overlapping occurrences of `from`
+ *   replaced by `to`, scanning from left to right.
+ *
+ * @param str The string to replace in.
+ * @param from The substring to replace.
+ * @param to The replacement for `from`.
+ * @return The string with all occurrences of `from` replaced.
+ */
+std::string string_with_all_occurrences_replaced(const std::string &str,
+                                                 const std::string &from,
+                                                 const std::string &to) {
+    std::string replaced;
+    replaced.reserve(str.size());
+    std::size_t unmatched_start = 0;
+    std::size_t match_start = str.find(from);
+    while (match_start != std::string::npos) {
+        replaced.append(str, unmatched_start, match_start - unmatched_start);
+        replaced += to;
+        unmatched_start = match_start + from.size();
+        match_start = str.find(from, unmatched_start);
+    }
+    replaced.append(str, unmatched_start, std::string::npos);
+    return replaced;
+}
+
 /**
  * @brief Masks a single label within the supplied answer, given the current
  *   state of the already-existent mask names for entities and properties
@@ -337,7 +392,8 @@ void DutchKBQADSCreate::mask_single_entity_or_property_in_answer(std::string &a,
                                  match.label +
                                  ")!");
     }
-    a = std::regex_replace(a, std::regex("(" + match.ent_or_prp + ")"), potential_replacement->second);
+    /* Entities and properties (e.g. "Q5") are plain text, so no RegEx is needed. */
+    a = string_with_all_occurrences_replaced(a, match.ent_or_prp, potential_replacement->second);
 }
 
 /**
@@ -384,6 +440,12 @@ std::optional<QuestionAnswerPair> DutchKBQADSCreate::masked_question_answer_pair
     return QuestionAnswerPair(qa_pair.uid, replaced_q, replaced_a);
 }
 
+/**
+ * @brief The number of question-answer pairs to mask between two progress
+ *   reports. Reporting after every single pair floods standard output.
+ */
+const std::size_t progress_report_interval = 100;
+
 /**
  * @brief Masks all question-answer pairs present in the LC-QuAD 2.0 dataset
  *   split-natural language pair and returns the results as a JSON object.
@@ -415,7 +477,7 @@ Json::Value DutchKBQADSCreate::masked_question_answer_pairs(const LCQuADSplit &s
             json_masked_qa_pair["a"] = masked.value().a;
             json[std::to_string(qa_pair.uid)] = json_masked_qa_pair;
         }
-        if (!quiet) {
+        if (!quiet && counter % progress_report_interval == 0) {
             printf("\rMasking question-answer pairs... (%6.2lf%%)",
                    (static_cast<double>(counter) / static_cast<double>(qa_pairs.size())) * 100.);
             std::cout << std::flush;
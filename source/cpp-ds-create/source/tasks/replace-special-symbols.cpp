@@ -31,23 +31,30 @@ std::regex symbol_replacement_search_query(const std::map<std::string, std::stri
 /**
  * @brief Returns the input string, but with specified symbols replaced.
  *
+ * The string is traversed only once: unmatched stretches are copied as-is,
+ * and each matched symbol is substituted by its replacement in place.
+ *
  * @param str The string to replace symbols in.
  * @param replace_map The symbol replacement map.
  * @param search_query A RegEx for finding the keys of `replace_map`.
  * @return The string with symbols replaced.
  */
-std::string string_with_symbols_replaced(std::string str,
+std::string string_with_symbols_replaced(const std::string &str,
                                          const std::map<std::string, std::string> &replace_map,
                                          const std::regex &search_query) {
-    std::string replaced = str;  /* the string, but with symbols replaced */
+    std::string replaced;  /* the string, but with symbols replaced */
+    replaced.reserve(str.size());
+    auto unmatched_begin = str.cbegin();
     for (std::sregex_iterator it(str.begin(), str.end(), search_query);
          it != std::sregex_iterator();
          ++it) {
         /* iterate over all symbols to replace */
+        replaced.append(unmatched_begin, (*it)[0].first);
         std::string matched_symbol = string_with_regex_characters_escaped(it->str());
-        std::regex matched_symbol_query("(" + matched_symbol + ")");
-        replaced = std::regex_replace(replaced, matched_symbol_query, replace_map.at(matched_symbol));
+        replaced += replace_map.at(matched_symbol);
+        unmatched_begin = (*it)[0].second;
     }
+    replaced.append(unmatched_begin, str.cend());
     return replaced;
 }
 
@@ -139,65 +146,62 @@ HTMLEntityType html_entity_type(const std::string &html_entity) {
 }
 
 /**
- * @brief Returns the input string, but with the given HTML character entity
- *   replaced by its referent.
+ * @brief Returns the referent of the given HTML character entity.
  *
- * @param str The string to replace in.
- * @param entity The HTML character entity to replace.
- * @return The string with the HTML character entity replaced.
+ * @param entity The HTML character entity to obtain the referent of.
+ * @return The referent of the HTML character entity.
  */
-std::string string_with_html_character_entity_replaced(const std::string &str,
-                                                       const std::string &entity) {
-    return std::regex_replace(str,
-                              std::regex("(" + entity + ")"),
-                              html_character_entity_map.at(entity));
+std::string html_character_entity_referent(const std::string &entity) {
+    return html_character_entity_map.at(entity);
 }
 
 /**
- * @brief Returns the input string, but with the given HTML numeric entity
- *   replaced by its referent.
+ * @brief Returns the referent of the given HTML numeric entity.
  *
  * This function will only convert entities with numeric codes between #0 and
  * #255 (both ends inclusive).
  *
- * @param str The string to replace in.
- * @param entity The HTML numeric entity to replace.
- * @return The string with the HTML numeric entity replaced.
+ * @param entity The HTML numeric entity to obtain the referent of.
+ * @return The referent of the HTML numeric entity.
  */
-std::string string_with_html_numeric_entity_replaced(const std::string &str,
-                                                     const std::string &entity) {
+std::string html_numeric_entity_referent(const std::string &entity) {
     std::smatch code_point_match;  /* Stores only the four digits (U+0000) of the entity. */
     std::regex_search(entity,
                       code_point_match,
                       code_point_query);
-    std::string referent { static_cast<char>(std::stoi(code_point_match.str())) };
-    return std::regex_replace(str,
-                              std::regex("(" + entity + ")"),
-                              referent);
+    return std::string { static_cast<char>(std::stoi(code_point_match.str())) };
 }
 
 /**
  * @brief Returns the input string, but with HTML entities replaced.
  *
+ * The string is traversed only once: unmatched stretches are copied as-is,
+ * and each HTML entity is substituted by its referent in place.
+ *
  * @param str The string to replace HTML entities in.
  * @return The string with HTML entities replaced by the symbols they refer to.
  */
-std::string string_with_html_entities_replaced(std::string str) {
-    std::string replaced = str;  /* the string with HTML entities replaced */
+std::string string_with_html_entities_replaced(const std::string &str) {
+    std::string replaced;  /* the string with HTML entities replaced */
+    replaced.reserve(str.size());
+    auto unmatched_begin = str.cbegin();
     for (std::sregex_iterator it(str.begin(), str.end(), html_entity_query);
          it != std::sregex_iterator();
          ++it) {
         /* iterate over all HTML entities to replace */
+        replaced.append(unmatched_begin, (*it)[0].first);
         std::string matched_entity = it->str();
         switch (html_entity_type(matched_entity)) {
             case HTMLEntityType::CHARACTER:
-                replaced = string_with_html_character_entity_replaced(replaced, matched_entity);
+                replaced += html_character_entity_referent(matched_entity);
                 break;
             case HTMLEntityType::NUMERIC:
-                replaced = string_with_html_numeric_entity_replaced(replaced, matched_entity);
+                replaced += html_numeric_entity_referent(matched_entity);
                 break;
         }
+        unmatched_begin = (*it)[0].second;
     }
+    replaced.append(unmatched_begin, str.cend());
     return replaced;
 }
 
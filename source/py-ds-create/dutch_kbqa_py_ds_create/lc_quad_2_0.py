@@ -1,8 +1,7 @@
 """Symbols for working with the LC-QuAD 2.0 dataset."""
 
 import os
-import json
-from dutch_kbqa_py_ds_create.utilities import ROOT_DIR
+from dutch_kbqa_py_ds_create.utilities import ROOT_DIR, json_decoded
 from typing import Union, Literal, TypedDict, List, Optional, cast
 
 
@@ -49,8 +48,8 @@ def dataset_split(split: Split) -> List[LCQuADQAPair]:
     """
     file = TRAIN_FILE if split == 'train' else TEST_FILE
     try:
-        with open(file, mode='r') as handle:
-            ds_split = cast(List[LCQuADQAPair], json.load(handle))
+        with open(file, mode='rb') as handle:
+            ds_split = cast(List[LCQuADQAPair], json_decoded(handle.read()))
     except FileNotFoundError:
         raise RuntimeError(f'File \'{file.resolve()}\' was not found!')
     except IOError as error:
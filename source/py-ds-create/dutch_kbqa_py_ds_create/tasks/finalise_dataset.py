@@ -6,13 +6,25 @@ from dutch_kbqa_py_ds_create.lc_quad_2_0 import Split, DATASET_DIR
 from dutch_kbqa_py_ds_create.utilities import NaturalLanguage, \
                                               QuestionAnswerPair, \
                                               json_loaded_from_disk, \
-                                              ensure_directory_exists, \
-                                              only_unique
-from typing import List, Union, Literal, Dict, Callable, AnyStr, Tuple
+                                              ensure_directory_exists
+from typing import List, Union, Literal, Dict, AnyStr
 
 
 FINALISED_DATASET_DIR = DATASET_DIR / "finalised"
 
+# Regular expressions used while post-processing question-answer pairs. These
+# are applied to every pair of a dataset split, so we compile them only once.
+VARIABLE_REG_EXP = re.compile(r'(\?)[^ ]+')  # e.g. `?ans_1`
+MASK_REG_EXP = re.compile('[pq][0-9]+')
+REPEATED_SPACES_REG_EXP = re.compile('( ){2,}')
+NAMESPACE_REG_EXP = re.compile('([a-z]+:)(?=[pq][0-9]+)')  # e.g. `wdt:`
+ANSWER_SPECIAL_SYMBOLS_TABLE = str.maketrans({'{': ' brack_open ',
+                                              '}': ' brack_close ',
+                                              '(': ' attr_open ',
+                                              ')': ' attr_close ',
+                                              '.': ' sep_dot ',
+                                              ',': ' , '})
+
 Partition = Union[Literal['train'], Literal['validation'], Literal['test']]
 PartitionedQAPairs = Dict[Partition, List[QuestionAnswerPair]]
 
@@ -32,44 +44,32 @@ def loaded_pre_finalised_dataset_split(split: Split,
     location = DATASET_DIR / \
                f'{split}-{language.value}-replaced-no-errors-masked.json'
     raw = json_loaded_from_disk(location, upon_file_not_found='throw-error')
-    out: List[QuestionAnswerPair] = []
-    for uid_str, qa_pair in raw.items():
-        uid = int(uid_str)
-        out.append(QuestionAnswerPair(uid=uid,
-                                      question=qa_pair['q'],
-                                      answer=qa_pair['a']))
-    return out
-
-
-def string_with_substitutions(string: str,
-                              substitutions: List[Tuple[str, str]]) -> str:
-    """Returns the string, but with the requested substitutions performed on
-    it.
-    
-    Substitutions are performed in the order of the list.
-    
-    :param string: The string to manipulate.
-    :param substitutions: The substitutions to perform. Order matters.
-    :returns: The manipulated string.
-    """
-    for before, after in substitutions:
-        string = re.sub(before, after, string)
-    return string
+    return [QuestionAnswerPair(uid=int(uid_str),
+                               question=qa_pair['q'],
+                               answer=qa_pair['a'])
+            for uid_str, qa_pair in raw.items()]
 
 
 def answer_with_variables_replaced(answer: str) -> str:
     """Returns the given question-answer pair answer, except that the variables
     have been replaced with more word-like counterparts.
     
+    Variables are numbered in order of first appearance. Each variable is
+    matched as a whole, so variables that share a prefix (say, `?sbj` and
+    `?sbj_label`) get distinct replacements.
+
     :param answer: The original answer.
     :returns: The manipulated answer.
     """
-    variable_reg_exp = '(\?)[^ ]+'  # e.g. `?ans_1`
-    raw = list(re.finditer(variable_reg_exp, answer))
-    matches = only_unique([match.group() for match in raw])
-    for index, match in enumerate(matches):
-        answer = re.sub(f'(\\?{match[1:]})', f'var_{index + 1}', answer)
-    return answer
+    replacements: Dict[str, str] = {}
+
+    def replacement(match: re.Match[AnyStr]) -> str:
+        variable = match.group()
+        if variable not in replacements:
+            replacements[variable] = f'var_{len(replacements) + 1}'
+        return replacements[variable]
+
+    return VARIABLE_REG_EXP.sub(replacement, answer)
 
 
 def post_processed_question(question: str) -> str:
@@ -79,12 +79,11 @@ def post_processed_question(question: str) -> str:
     :param question: The question to post-process.
     :returns: The post-processed question.
     """
-    add_space: Callable[[re.Match[AnyStr]], str] = lambda match: f' {match.group()} '
     question = question.lower()
-    question = re.sub('[pq][0-9]+', add_space, question)
-    return string_with_substitutions(question,
-                                     [('(\?)$', ' ?'),
-                                      ('( ){2,}', ' ')],)
+    question = MASK_REG_EXP.sub(r' \g<0> ', question)
+    if question.endswith('?'):
+        question = question[:-1] + ' ?'
+    return REPEATED_SPACES_REG_EXP.sub(' ', question)
 
 
 def post_processed_answer(answer: str) -> str:
@@ -96,19 +95,13 @@ def post_processed_answer(answer: str) -> str:
     :returns: The post-processed answer.
     """
     answer = answer.lower()
-    answer = string_with_substitutions(answer,
-                                       [('[\{]', ' brack_open '),
-                                        ('[\}]', ' brack_close '),
-                                        ('[\(]', ' attr_open '),
-                                        ('[\)]', ' attr_close '),
-                                        ('[\.]', ' sep_dot '),
-                                        ('[,]', ' , '),
-                                        ('([a-z]+:)(?=[pq][0-9]+)', '')])
+    # Translating all special symbols at once takes a single pass over the
+    # answer, rather than one pass per symbol.
+    answer = answer.translate(ANSWER_SPECIAL_SYMBOLS_TABLE)
+    answer = NAMESPACE_REG_EXP.sub('', answer)
     answer = answer_with_variables_replaced(answer)
-    answer = string_with_substitutions(answer,
-                                       [('[ ]{2,}', ' '),
-                                        ('( )+$', '')])
-    return answer
+    answer = REPEATED_SPACES_REG_EXP.sub(' ', answer)
+    return answer.rstrip(' ')
 
 
 def post_processed_question_answer_pair(qa_pair: QuestionAnswerPair) -> \
@@ -158,14 +151,13 @@ def save_partitioned_question_answer_pairs(partitioned: PartitionedQAPairs,
     """
     ensure_directory_exists(FINALISED_DATASET_DIR)
     for partition, qa_pairs in partitioned.items():
-        questions = [qa_pair.question + '\n' for qa_pair in qa_pairs]
-        answers = [qa_pair.answer + '\n' for qa_pair in qa_pairs]
         with open(FINALISED_DATASET_DIR / f'{partition}-{language.value}.txt',
-                  'w') as handle:
-            handle.writelines(questions)
-        with open(FINALISED_DATASET_DIR / f'{partition}-sparql.txt',
-                  'w') as handle:
-            handle.writelines(answers)
+                  'w') as q_handle, \
+             open(FINALISED_DATASET_DIR / f'{partition}-sparql.txt',
+                  'w') as a_handle:
+            for qa_pair in qa_pairs:
+                q_handle.write(qa_pair.question + '\n')
+                a_handle.write(qa_pair.answer + '\n')
 
 
 def finalise_dataset_split(split: Split,
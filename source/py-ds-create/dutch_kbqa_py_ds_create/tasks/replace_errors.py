@@ -11,6 +11,12 @@ from dutch_kbqa_py_ds_create.utilities import NaturalLanguage, \
 from typing import Dict, cast
 
 
+# Matches the `ERROR` placeholders left behind by translation.
+ERROR_REG_EXP = re.compile('(ERROR)[0-9]+')
+# Matches a question's closing question mark, along with a space before it.
+TRAILING_QUESTION_MARK_REG_EXP = re.compile('( )?(\\?)$')
+
+
 def error_replacement_dict(split: Split,
                            language: NaturalLanguage) -> Dict[str, str]:
     """Returns a mapping from UIDs to `ERROR` replacements.
@@ -50,9 +56,9 @@ def replace_errors(file_with_errors: Path,
                                              upon_file_not_found='throw-error')
     assert(uid_question_map is not None)
     for uid, replacement in error_replacement_dict(split, language).items():
-        uid_question_map[uid] = re.sub('(ERROR)[0-9]+',
-                                       replacement,
-                                       uid_question_map[uid])
-        uid_question_map[uid] = re.sub('( )?(\\?)$', '?', uid_question_map[uid])
+        uid_question_map[uid] = ERROR_REG_EXP.sub(replacement,
+                                                  uid_question_map[uid])
+        uid_question_map[uid] = \
+            TRAILING_QUESTION_MARK_REG_EXP.sub('?', uid_question_map[uid])
     save_json_to_disk(uid_question_map,
                       DATASET_DIR / file_without_errors)
@@ -1,6 +1,7 @@
 """Symbols for translating texts using Google Cloud Translate."""
 
 import six
+from functools import lru_cache
 from dotenv import load_dotenv
 from google.cloud import translate_v2 as translate
 from pathlib import Path
@@ -15,33 +16,65 @@ from dutch_kbqa_py_ds_create.utilities import NaturalLanguage, \
 from typing import Union, List, Dict, Set, cast
 
 
-def translated_text(text: Union[str, six.binary_type],
-                    tgt_language: NaturalLanguage,
-					src_language: NaturalLanguage) -> str:
-	"""Returns `text`, machine-translated into the desired `tgt_language`.
+# Google Cloud Translate accepts at most this many texts per request.
+MAX_TEXTS_PER_REQUEST = 128
+
+
+@lru_cache(maxsize=1)
+def translation_client() -> translate.Client:
+	"""Returns the Google Cloud Translate client.
+
+	The client is created upon the first call and reused afterwards, so that
+	credentials and the HTTP session are only set up once per process. Make
+	sure the environment (see `load_dotenv`) is loaded before the first call.
+
+	:returns: The client.
+	"""
+	return translate.Client()
+
+
+def translated_texts(texts: List[Union[str, six.binary_type]],
+                     tgt_language: NaturalLanguage,
+					 src_language: NaturalLanguage) -> List[str]:
+	"""Returns `texts`, machine-translated into the desired `tgt_language`.
+
+	The texts are sent to Google Cloud Translate in batches of at most
+	`MAX_TEXTS_PER_REQUEST`, rather than one request per text. Texts that
+	occur more than once are only translated once.
 
 	If you encounter a `ValueError` when calling this function, it is likely
-	that your `text` uses a text encoding different from UTF-8, such as
-	ISO 8859-1.
-
-	:param text: The text to translate.
-	:param tgt_language: The language to translate `text` into.
-	:param src_language: The language in which `text` is written.
-	:returns: `text`, machine-translated into `tgt_language`.
-	:raises: `ValueError` if `text` is binary but not properly encoded as
+	that one of your `texts` uses a text encoding different from UTF-8, such
+	as ISO 8859-1.
+
+	:param texts: The texts to translate.
+	:param tgt_language: The language to translate `texts` into.
+	:param src_language: The language in which `texts` are written.
+	:returns: `texts`, machine-translated into `tgt_language`, in the same
+		order.
+	:raises: `ValueError` if a text is binary but not properly encoded as
 		UTF-8.
 	"""
-	client = translate.Client()
-	if isinstance(text, six.binary_type):
-		try:	
-			text = text.decode(encoding='utf-8')
-		except UnicodeDecodeError:
-			raise ValueError('`text` is binary but not (correctly) UTF-8 ' +
-			                 'encoded.')
-	result = client.translate(text,
-	                          target_language=tgt_language.value,
-	                          source_language=src_language.value)
-	return result['translatedText']
+	client = translation_client()
+	decoded: List[str] = []
+	for text in texts:
+		if isinstance(text, six.binary_type):
+			try:
+				text = text.decode(encoding='utf-8')
+			except UnicodeDecodeError:
+				raise ValueError('A text is binary but not (correctly) UTF-8 ' +
+				                 'encoded.')
+		decoded.append(text)
+	# Drop repeated texts, keeping first-occurrence order.
+	unique = list(dict.fromkeys(decoded))
+	translations: Dict[str, str] = {}
+	for start_index in range(0, len(unique), MAX_TEXTS_PER_REQUEST):
+		batch = unique[start_index:start_index + MAX_TEXTS_PER_REQUEST]
+		results = client.translate(batch,
+		                           target_language=tgt_language.value,
+		                           source_language=src_language.value)
+		for text, result in zip(batch, results):
+			translations[text] = result['translatedText']
+	return [translations[text] for text in decoded]
 
 
 TranslatedLCQuADQuestions = Dict[str, str]
@@ -84,38 +117,42 @@ def questions_still_to_translate(ds_split: List[LCQuADQAPair],
 	return all_uids.difference(trl_questions_uids(trl_questions))
 
 
-def translate_dataset_split_questions(ds_split: List[LCQuADQAPair],
+def translate_dataset_split_questions(uids_to_qa_pairs: Dict[int, LCQuADQAPair],
                                       trl_questions: TranslatedLCQuADQuestions,
 							          language: NaturalLanguage,
 									  question_uids: Set[int]) -> None:
-	"""Translates questions from LC-QuAD 2.0 dataset split `ds_split` into
-	`language`.
+	"""Translates questions from an LC-QuAD 2.0 dataset split into `language`.
 
 	This function translates questions with UIDs from `question_uids` in
-	`ds_split` and places them into `trl_questions`. It is your responsibility
-	to maintain `trl_questions`.
+	`uids_to_qa_pairs` and places them into `trl_questions`. It is your
+	responsibility to maintain `trl_questions`.
 
-	:param ds_split: The LC-QuAD 2.0 dataset split to translate questions of.
+	:param uids_to_qa_pairs: A mapping from UIDs to the question-answer pairs
+		of the LC-QuAD 2.0 dataset split to translate questions of. Build it
+		once per split, not once per call.
 	:param trl_questions: A mapping from stringified UIDs to translated
 		questions. Already-translated questions. May be incomplete or even
 		empty.
 	:param language: The language to translate into.
 	:param question_uids: The UIDs of the questions to translate.
 	"""
-	assert question_uids.issubset(ds_split_uids(ds_split))
-	assert question_uids.isdisjoint(trl_questions_uids(trl_questions))
-	uids_to_qa_pairs = {pair['uid']: pair for pair in ds_split}
-	for uid in question_uids:
+	assert question_uids.issubset(uids_to_qa_pairs.keys())
+	assert all(str(uid) not in trl_questions for uid in question_uids)
+	uids = list(question_uids)
+	texts: List[Union[str, six.binary_type]] = []
+	for uid in uids:
 		pair = uids_to_qa_pairs[uid]
 		question_type = question_type_for_translation(pair)
 		text = pair[question_type]
 		assert isinstance(text, str)
-		# Note: LC-QuAD 2.0 is written in English, warranting us setting the
-		# `src_language` to `NaturalLanguage.ENGLISH` without user 
-		# intervention.
-		trl = translated_text(text,
-		                      tgt_language=language,
-							  src_language=NaturalLanguage.ENGLISH)
+		texts.append(text)
+	# Note: LC-QuAD 2.0 is written in English, warranting us setting the
+	# `src_language` to `NaturalLanguage.ENGLISH` without user 
+	# intervention.
+	trls = translated_texts(texts,
+	                        tgt_language=language,
+							src_language=NaturalLanguage.ENGLISH)
+	for uid, trl in zip(uids, trls):
 		trl_questions[str(uid)] = trl
 
 
@@ -169,13 +206,8 @@ def question_uid_partition(ds_split: List[LCQuADQAPair],
 	assert save_freq >= 1
 	uids = list(questions_still_to_translate(ds_split, trl_questions))
 	print(f'Found {len(uids)} questions still to translate.')
-	start_index = 0  # inclusive
-	partition: List[Set[int]] = []
-	while start_index < len(uids):
-		stop_index = min(start_index + save_freq, len(uids))  # exclusive
-		partition.append(set(uids[start_index:stop_index]))
-		start_index += save_freq
-	return partition
+	return [set(uids[start_index:start_index + save_freq])
+	        for start_index in range(0, len(uids), save_freq)]
 
 
 def summarised_uids_set(uids_set: Set[int]) -> str:
@@ -211,6 +243,7 @@ def translate_complete_dataset_split_questions(split: Split,
 	assert save_freq >= 1
 	_ = load_dotenv()  # for loading the `.env`
 	ds_split = dataset_split(split)
+	uids_to_qa_pairs = {pair['uid']: pair for pair in ds_split}
 	trl_questions = trl_questions_from_disk(file)
 	partition = question_uid_partition(ds_split, trl_questions, save_freq)
 	if not quiet and len(partition) == 0:
@@ -219,7 +252,7 @@ def translate_complete_dataset_split_questions(split: Split,
 		overwritably_print('Starting translation of split %s into \'%s\'...' %
 		                   (split, language))
 	for index, part in enumerate(partition):
-		translate_dataset_split_questions(ds_split,
+		translate_dataset_split_questions(uids_to_qa_pairs,
 		                                  trl_questions,
 		                                  language,
 		                                  question_uids=part)
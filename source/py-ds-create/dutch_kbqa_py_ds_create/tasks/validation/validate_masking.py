@@ -6,12 +6,15 @@ import re
 from pathlib import Path
 from dutch_kbqa_py_ds_create.utilities import json_loaded_from_disk, \
                                               QuestionAnswerPair
-from typing import Dict, Any, List, Set, Union, Literal
+from typing import Dict, Any, List, Set, Union, Literal, Callable, AnyStr
 
 
 MaskedQAPairsMap = Dict[int, QuestionAnswerPair]
 SymbolSwitchDirection = Union[Literal['forward'], Literal['backward']]
 
+# Matches entity and property masks in their original (unswitched) state.
+MASK_REG_EXP = re.compile('[QP][0-9]+')
+
 
 def mask_file_to_masked_qa_pairs_map(mask_file: Dict[str, Any]) -> \
         MaskedQAPairsMap:
@@ -39,6 +42,12 @@ SWITCH_MAP: Dict[SymbolSwitchDirection, Dict[str, str]] = \
      'backward': {'R': 'P',
                   'S': 'Q'}}
 
+# Per direction, a regular expression that matches the masks whose symbols can
+# be 'switched' into that direction.
+SWITCH_REG_EXPS: Dict[SymbolSwitchDirection, re.Pattern] = \
+    {direction: re.compile(f'[{"".join(sub_map.keys())}][0-9]+')
+     for direction, sub_map in SWITCH_MAP.items()}
+
 
 def switched_mask_symbol(mask: str,
                          direction: SymbolSwitchDirection) -> str:
@@ -53,17 +62,15 @@ def switched_mask_symbol(mask: str,
         state, or vice-versa, depending on `direction`.
     :param direction: The direction of the switch.
     """
-    legal_keys: List[str] = list(SWITCH_MAP[direction].keys())
-    assert(re.search(f'^[{"".join(legal_keys)}][0-9]+$', mask))
-    for key, switch_symbol in SWITCH_MAP[direction].items():
-        if mask[0] == key:
-            return f'{switch_symbol}{mask[1:]}'
-    raise RuntimeError('Couldn\'t fit any key. Is the `direction` correct?')
+    assert(SWITCH_REG_EXPS[direction].fullmatch(mask))
+    switch_symbol = SWITCH_MAP[direction].get(mask[0])
+    if switch_symbol is None:
+        raise RuntimeError('Couldn\'t fit any key. Is the `direction` correct?')
+    return f'{switch_symbol}{mask[1:]}'
 
 
 def sentence_mask_symbols_switched(sen: str,
-                                   direction: SymbolSwitchDirection) -> \
-        QuestionAnswerPair:
+                                   direction: SymbolSwitchDirection) -> str:
     """'Switches' entity and property masks' first letters (their 'symbols')
     from their original states to 'switched' counterpart states, or vice-versa.
 
@@ -74,13 +81,9 @@ def sentence_mask_symbols_switched(sen: str,
     :param sen: The sentence in which to perform mask symbol switching.
     :param direction: The direction of the switch.
     """
-    original_keys: List[str] = list(SWITCH_MAP[direction].keys())
-    to_switch = re.findall(f'[{"".join(original_keys)}][0-9]+', sen)
-    for symbol_to_switch in to_switch:
-        switched_symbol = switched_mask_symbol(symbol_to_switch,
-                                               direction)
-        sen = sen.replace(symbol_to_switch, switched_symbol)
-    return sen
+    switch: Callable[[re.Match[AnyStr]], str] = \
+        lambda match: switched_mask_symbol(match.group(), direction)
+    return SWITCH_REG_EXPS[direction].sub(switch, sen)
 
 
 def reference_to_proposal_masks_map(prp_pair: QuestionAnswerPair,
@@ -99,8 +102,8 @@ def reference_to_proposal_masks_map(prp_pair: QuestionAnswerPair,
     :returns: The mapping.
     """
     assert(prp_pair.uid == ref_pair.uid)
-    prp_masks: List[str] = re.findall('[QP][0-9]+', prp_pair.part(which=part))
-    ref_masks: List[str] = re.findall('[QP][0-9]+', ref_pair.part(which=part))
+    prp_masks: List[str] = MASK_REG_EXP.findall(prp_pair.part(which=part))
+    ref_masks: List[str] = MASK_REG_EXP.findall(ref_pair.part(which=part))
     try:
         assert(len(prp_masks) == len(ref_masks))
     except AssertionError:
@@ -135,10 +138,11 @@ def reference_masks_replaced_by_analogous_proposal_masks(
     :returns: The mapping.
     """
     masks_map = reference_to_proposal_masks_map(prp_pair, ref_pair, part)
-    out = ref_pair.part(which=part)
-    for ref_mask, prp_mask in masks_map.items():
-        out = out.replace(ref_mask, prp_mask)
-    return out
+    # Replace all masks in one pass. This also prevents a mask from clobbering
+    # longer masks that it is a prefix of (e.g. `Q1` and `Q12`).
+    replace: Callable[[re.Match[AnyStr]], str] = \
+        lambda match: masks_map[match.group()]
+    return MASK_REG_EXP.sub(replace, ref_pair.part(which=part))
 
 
 def successful_single_masks_validation(prp_pair: QuestionAnswerPair,
@@ -201,8 +205,8 @@ def validate_masking_against_reference(proposal_file: Path,
         for uid in ref_masks.keys():
             prp_pair = prp_masks[uid]
             ref_pair = ref_masks[uid]
-            if not successful_single_masks_validation(prp_masks[uid],
-                                                      ref_masks[uid],
+            if not successful_single_masks_validation(prp_pair,
+                                                      ref_pair,
                                                       part):
                 print('(UID=%6d)' % (uid,))
                 print('\t(Prop.) \'%s\'' % (prp_pair.part(which=part)))
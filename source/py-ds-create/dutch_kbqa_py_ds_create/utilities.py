@@ -5,7 +5,14 @@ import json
 import platform
 from pathlib import Path
 from enum import Enum
-from typing import Union, Literal, Dict, Any, Optional, List
+from typing import Union, Literal, Dict, Any, Optional
+
+# `orjson` decodes and encodes JSON considerably faster than the standard
+# library does. It is optional: without it, we fall back to `json`.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Absolute file system path to the package's root (base) directory.
@@ -33,6 +40,28 @@ def overwritably_print(text: str) -> None:
         print(text, flush=True)
 
 
+def json_decoded(raw: bytes) -> Any:
+    """Returns the UTF-8 encoded JSON document `raw`, decoded.
+
+    :param raw: The JSON document's bytes.
+    :returns: The decoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_encoded(contents: Any) -> bytes:
+    """Returns `contents`, encoded as a UTF-8 JSON document.
+
+    :param contents: The contents to encode.
+    :returns: The JSON document's bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(contents)
+    return json.dumps(contents).encode('utf-8')
+
+
 FileNotFoundReaction = Union[Literal['throw-error'],
                              Literal['return-none']]
 
@@ -51,8 +80,8 @@ def json_loaded_from_disk(location: Path,
     :throws: `RuntimeError` when anything abnormal happens.
     """
     try:
-        with open(location, 'r') as handle:
-            contents = json.load(handle)
+        with open(location, 'rb') as handle:
+            contents = json_decoded(handle.read())
             assert(type(contents) == dict)
             return contents
     except FileNotFoundError:
@@ -70,13 +99,19 @@ def save_json_to_disk(contents: Dict[str, Any],
                       location: Path) -> None:
     """Saves the `contents` as JSON to disk, at the specified `location`.
 
+    The contents are first written to a temporary file next to `location`,
+    which then replaces `location` in one go. An interrupted save thus
+    leaves the previous file at `location` intact.
+
     :param contents: The contents to save to disk.
     :param location: An absolute or relative file system location to save to.
     :throws: `RuntimeError` when anything abnormal happens.
     """
+    temporary = location.with_name(f'{location.name}.tmp')
     try:
-        with open(location, 'w') as handle:
-            json.dump(contents, handle)
+        with open(temporary, 'wb') as handle:
+            handle.write(json_encoded(contents))
+        os.replace(temporary, location)
     except FileNotFoundError:
         raise RuntimeError(f'File \'{location.resolve()}\' was not found!')
     except IOError as error:
@@ -88,6 +123,10 @@ class QuestionAnswerPair:
     split.
     """
 
+    # Pairs are created in bulk (several times per dataset split), so we avoid
+    # giving each instance its own attribute dictionary.
+    __slots__ = ('uid', 'question', 'answer')
+
     class Part(Enum):
         """A part of a question-answer pair: the question or the answer."""
         QUESTION = 'question'
@@ -127,24 +166,9 @@ def ensure_directory_exists(location: Path) -> None:
 
     :param location: The location the directory should be at.
     """
-    if not os.path.exists(location):
+    try:
         os.makedirs(location)
-        print('Created directory \'%s\' as it wasn\'t there yet.' %
-              (str(location.resolve()),))
-
-
-def only_unique(li: List[str]) -> List[str]:
-    """Returns the list with only the unique values stored within it.
-    
-    Importantly, this function preserves the order of `li`, unlike a simpler
-    call to `list(set(li))`. Prefer this method if preserving order is
-    important.
-
-    :param li: The list to get only the unique values of.
-    :returns: `li`, but with only the unique values. Order is preserved.
-    """
-    unique: List[str] = []
-    for entry in li:
-        if entry not in unique:
-            unique.append(entry)
-    return unique
+    except FileExistsError:
+        return
+    print('Created directory \'%s\' as it wasn\'t there yet.' %
+          (str(location.resolve()),))
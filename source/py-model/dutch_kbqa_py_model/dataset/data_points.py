@@ -1,5 +1,6 @@
 """Symbols for loading in and pre-processing language model data points."""
 
+from itertools import islice, zip_longest
 from pathlib import Path
 from transformers import PreTrainedTokenizer
 from dutch_kbqa_py_model.utilities import DEBUG_MODE, \
@@ -42,14 +43,13 @@ def loaded_raw_data_points(natural_language_file: Path,
     data_points: List[RawDataPoint] = []
     with open(natural_language_file, mode='r', encoding='utf-8') as nl_handle, \
          open(query_language_file, mode='r', encoding='utf-8') as ql_handle:
+        # Read both files line by line, instead of loading them into memory
+        # first. A missing line on either side signals a length mismatch.
+        lines = zip_longest(nl_handle, ql_handle)
         if DEBUG_MODE:
-            nl_lines = nl_handle.readlines()[:DEBUG_NUMBER_DATA_POINTS]
-            ql_lines = ql_handle.readlines()[:DEBUG_NUMBER_DATA_POINTS]
-        else:
-            nl_lines = nl_handle.readlines()
-            ql_lines = ql_handle.readlines()
-        assert(len(nl_lines) == len(ql_lines))
-        for idx, (question, query) in enumerate(zip(nl_lines, ql_lines)):
+            lines = islice(lines, DEBUG_NUMBER_DATA_POINTS)
+        for idx, (question, query) in enumerate(lines):
+            assert(question is not None and query is not None)
             data_points.append(RawDataPoint(idx=idx,
                                             natural_language=question.strip(),
                                             query_language=query.strip()))
@@ -140,6 +140,10 @@ SUPPORTED_MODEL_TRIPLES: Dict[SupportedModelType, ModelTriple] = \
      'random-xlm-roberta': ModelTriple(XLMRobertaConfig, XLMRobertaModel, XLMRobertaTokenizer)}
 
 
+# Matches a punctuation symbol together with at most one space on either side.
+PUNCTUATION_SPACING_REG_EXP = re.compile(r' ?([!"#$%&\'(’)*+,-./:;=?@\\^_`{|}~]) ?')
+
+
 class TransformerRunner:
     """A convenience class that helps you run transformer models."""
 
@@ -386,8 +390,7 @@ class TransformerRunner:
         
         :throws: `OSError` if a file system-related problem occurs.
         """
-        if not os.path.exists(self.save_dir):
-            os.makedirs(self.save_dir)
+        os.makedirs(self.save_dir, exist_ok=True)
 
     def is_random_model_type(self, model_type: SupportedModelType) -> bool:
         """Determines whether the supplied `model_type` is one of which the
@@ -405,7 +408,7 @@ class TransformerRunner:
         
         :returns: A pair. The en- and decoder configurations, respectively.
         """
-        configs: Tuple[PretrainedConfig, ...] = tuple()
+        configs: List[PretrainedConfig] = []
         prefix: EncOrDec
         for prefix in ('enc', 'dec'):
             model_type_str: SupportedModelType = \
@@ -427,7 +430,7 @@ class TransformerRunner:
                 assert(type(config.hidden_size) == int)
                 assert(hasattr(config, 'num_attention_heads'))
                 assert(type(config.num_attention_heads) == int)
-            configs += config,
+            configs.append(config)
         assert(len(configs) == 2)
         return cast(Tuple[PretrainedConfig, PretrainedConfig],
                     tuple(configs))
@@ -834,8 +837,10 @@ class TransformerRunner:
             inp_ids, inp_att_mask = batch
             with torch.no_grad():
                 predictions: torch.Tensor = self.trf(inp_ids, inp_att_mask)
-                for prediction in predictions:
-                    tkn_ids = list(prediction[0, :].cpu().numpy())
+                # Copy the batch's best beams to the host in one go, as plain
+                # Python integers rather than boxed NumPy scalars.
+                tkn_ids: List[int]
+                for tkn_ids in predictions[:, 0, :].cpu().tolist():
                     if 0 in tkn_ids:
                         # Remove any zero-padding tokens to the right.
                         tkn_ids = tkn_ids[:tkn_ids.index(0)]
@@ -865,9 +870,7 @@ class TransformerRunner:
         assert(len(predicted_sents) == len(ground_truth_raw_dps))
         for prd, gt in zip(predicted_sents, ground_truth_raw_dps):
             prd = prd.strip().replace('< ', '<').replace(' >', '>')
-            prd = re.sub(r' ?([!"#$%&\'(’)*+,-./:;=?@\\^_`{|}~]) ?',
-                         r'\1',
-                         prd)
+            prd = PUNCTUATION_SPACING_REG_EXP.sub(r'\1', prd)
             prd = prd.replace('attr_close>', 'attr_close >')
             prd = prd.replace('_attr_open', '_ attr_open')
             prd = prd.replace(' [ ', ' [').replace(' ] ', '] ')
@@ -972,8 +975,7 @@ class TransformerRunner:
         best_ckpt_dir = \
             (self.save_dir / \
              TransformerRunner.BEST_BLEU_CKPT_DIR).resolve()
-        if not os.path.exists(best_ckpt_dir):
-            os.makedirs(best_ckpt_dir)
+        os.makedirs(best_ckpt_dir, exist_ok=True)
         trf_to_save: torch.nn.Module = self.trf.module \
                                        if hasattr(self.trf, 'module') else \
                                        self.trf
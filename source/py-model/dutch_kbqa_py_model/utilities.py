@@ -7,6 +7,7 @@ import re
 import os
 import torch
 import torch.backends.cudnn as cudnn
+from functools import lru_cache
 from pathlib import PurePosixPath
 from requests.exceptions import ConnectionError
 from huggingface_hub.hf_api import HfApi, ModelInfo
@@ -21,21 +22,19 @@ FALSE_STRINGS = ('False', 'false', 'F', 'f')
 
 
 # Debugging.
-try:
-    if os.environ['DEBUG_MODE'] in TRUE_STRINGS:
-        DEBUG_MODE = True
-    elif os.environ['DEBUG_MODE'] in FALSE_STRINGS:
-        DEBUG_MODE = False
-    else:
-        raise ValueError('Environment variable `DEBUG_MODE`, if set, should ' +
-                         'have strictly one of the following values: ' +
-                         ', '.join([f'\'{val}\'' for val in TRUE_STRINGS]) +
-                         ' (for enabling debug mode), ' +
-                         ', '.join([f'\'{val}\'' for val in FALSE_STRINGS]) +
-                         '\'f\' (for disabling debug mode). If not set, ' +
-                         'debug mode is disabled.')
-except KeyError:
+_debug_mode_value = os.environ.get('DEBUG_MODE')
+if _debug_mode_value is None or _debug_mode_value in FALSE_STRINGS:
     DEBUG_MODE = False
+elif _debug_mode_value in TRUE_STRINGS:
+    DEBUG_MODE = True
+else:
+    raise ValueError('Environment variable `DEBUG_MODE`, if set, should ' +
+                     'have strictly one of the following values: ' +
+                     ', '.join([f'\'{val}\'' for val in TRUE_STRINGS]) +
+                     ' (for enabling debug mode), ' +
+                     ', '.join([f'\'{val}\'' for val in FALSE_STRINGS]) +
+                     '\'f\' (for disabling debug mode). If not set, ' +
+                     'debug mode is disabled.')
 
 
 # Logging-related global constants.
@@ -81,6 +80,10 @@ def hugging_face_hub_model_exists(author: Optional[str], model: str) -> bool:
     """Determines whether the model with author `author` and name `model`
     on HuggingFace Hub.
 
+    Answers are cached, because the same model is commonly checked multiple
+    times (e.g. as both configuration and tokeniser). Lookups that raise an
+    exception are not cached.
+
     :param author: The author of the model. May be omitted if a root-level
         model is searched for, such as `'bert-base-uncased'`.
     :param model: The model's name.
@@ -88,6 +91,22 @@ def hugging_face_hub_model_exists(author: Optional[str], model: str) -> bool:
     :throws: `RuntimeError` when connection problems arise, or `ValueError` if
         either `author` or `model` are empty strings.
     """
+    # Always pass the arguments positionally: `lru_cache` would otherwise
+    # cache keyword and positional calls for the same model separately.
+    return _cached_hugging_face_hub_model_exists(author, model)
+
+
+@lru_cache(maxsize=None)
+def _cached_hugging_face_hub_model_exists(author: Optional[str],
+                                          model: str) -> bool:
+    """Backs `hugging_face_hub_model_exists`, caching its answers.
+
+    :param author: The author of the model, or `None`.
+    :param model: The model's name.
+    :returns: Whether the model exists on HuggingFace Hub.
+    :throws: `RuntimeError` when connection problems arise, or `ValueError` if
+        either `author` or `model` are empty strings.
+    """
     id_or_path: str = model if author is None else f'{author}/{model}'
     if author is not None and author == '' or \
        model == '':